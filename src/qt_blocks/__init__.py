@@ -8,6 +8,14 @@ from qt_blocks import layouts
 _size_policy = QtWidgets.QSizePolicy
 Qt = QtCore.Qt
 
+# QMargins setters, in the same order as the `margins` property
+_margin_setters = (
+    QtCore.QMargins.setLeft,
+    QtCore.QMargins.setTop,
+    QtCore.QMargins.setRight,
+    QtCore.QMargins.setBottom,
+)
+
 
 class Block(QtWidgets.QFrame):
     """Base class for all blocks.
@@ -22,8 +30,8 @@ class Block(QtWidgets.QFrame):
         margins: t.Optional[t.Union[t.Sequence[int], int]] = None,
         spacing: t.Optional[int] = None,
         parent: t.Optional[QtCore.QObject] = None,
-        args=[],
-        kwargs=dict(),
+        args: t.Sequence = (),
+        kwargs: t.Optional[t.Dict[str, t.Any]] = None,
     ):
         """
         Args:
@@ -36,9 +44,17 @@ class Block(QtWidgets.QFrame):
                 no spacing will be set.  Only affects layouts that support
                 spacing.
             parent: The parent widget.
+            args (sequence, optional): Positional arguments for the layout.
+            kwargs (dict, optional): Keyword arguments for the layout.
         """
         super().__init__(parent=parent)
-        self._layout = layout_type(*args, **kwargs)
+        self._cached_layout: t.Optional[QtWidgets.QLayout] = None
+        if kwargs:
+            self._layout = layout_type(*args, **kwargs)
+        elif args:
+            self._layout = layout_type(*args)
+        else:
+            self._layout = layout_type()
         self._set_initial_layout_params(margins, spacing)
         self.setLayout(self._layout)
         self._widgets = list()
@@ -57,16 +73,24 @@ class Block(QtWidgets.QFrame):
     def layout(self):
         """Interface to the main layout of this block.
 
-        Block subclasses that have child widgets or nested layouts should
-        re-implement this property.
+        The layout is resolved once and cached.  Block subclasses that have
+        child widgets or nested layouts should re-implement _resolve_layout.
         """
+        layout = self._cached_layout
+        if layout is None:
+            layout = self._cached_layout = self._resolve_layout()
+        return layout
+
+    def _resolve_layout(self) -> QtWidgets.QLayout:
+        """Find the layout that the interface methods should operate on."""
         return self._layout
 
     def _set_margin(self, index, value):
         """Set a single margin value."""
-        margins = list(self.margins)
-        margins[index] = value
-        self.margins = margins
+        layout = self.layout
+        margins_obj = layout.contentsMargins()
+        _margin_setters[index](margins_obj, value)
+        layout.setContentsMargins(margins_obj)
 
     # -- Interface Methods and Properties ---------------------------------- #
     # these methods provide a convenient way to access functionality on child
@@ -79,6 +103,28 @@ class Block(QtWidgets.QFrame):
         self.layout.addWidget(widget)
         self._widgets.append(widget)
 
+    def add_many(self, widgets: t.Iterable[QtWidgets.QWidget]):
+        """Add several widgets to the block layout at once.
+
+        Painting is suspended while the widgets are added, so the block is
+        repainted once rather than once per widget.
+        """
+        layout = self.layout
+        # if updates are already off (e.g. disabled on an ancestor), leave
+        # them alone so the block follows the ancestor when it re-enables.
+        updates_enabled = self.updatesEnabled()
+        if updates_enabled:
+            self.setUpdatesEnabled(False)
+        try:
+            for widget in widgets:
+                if widget is None:
+                    continue
+                layout.addWidget(widget)
+                self._widgets.append(widget)
+        finally:
+            if updates_enabled:
+                self.setUpdatesEnabled(True)
+
     def insert(self, index, widget):
         """Insert a widget into the block layout at the given index.
 
@@ -90,14 +136,9 @@ class Block(QtWidgets.QFrame):
         self._widgets.insert(index, widget)
 
     @property
-    def margins(self):
-        margins_obj = self.layout.contentsMargins()
-        return [
-            margins_obj.left(),
-            margins_obj.top(),
-            margins_obj.right(),
-            margins_obj.bottom(),
-        ]
+    def margins(self) -> t.Tuple[int, int, int, int]:
+        # returns (left, top, right, bottom) in a single call into Qt
+        return tuple(self.layout.getContentsMargins())
 
     @margins.setter
     def margins(self, margins: t.Union[t.Sequence[int], int]):
@@ -105,8 +146,17 @@ class Block(QtWidgets.QFrame):
 
     def set_margins(self, layout, margins: t.Union[t.Sequence[int], int]):
         if isinstance(margins, int):
-            margins = [margins] * 4
-        layout.setContentsMargins(*margins)
+            self.set_margins_uniform(layout, margins)
+        else:
+            self.set_margins_sides(layout, *margins)
+
+    def set_margins_uniform(self, layout, margin: int):
+        """Set the same margin on all sides of a layout."""
+        layout.setContentsMargins(margin, margin, margin, margin)
+
+    def set_margins_sides(self, layout, left: int, top: int, right: int, bottom: int):
+        """Set each margin of a layout individually."""
+        layout.setContentsMargins(left, top, right, bottom)
 
     @property
     def margin_left(self):
@@ -183,53 +233,76 @@ class Block(QtWidgets.QFrame):
 
         This will remove any existing widgets from the layout.
         """
-        for existing_widget in self.widgets:
-            self.layout.takeAt(self.layout.indexOf(existing_widget))
-            if existing_widget not in new_widgets:
+        # new_widgets may be a one-shot iterable, and is used more than once
+        new_widgets = list(new_widgets)
+        layout = self.layout
+        existing_widgets = set(self._widgets)
+        kept_widgets = set(new_widgets)
+
+        # walk the layout once instead of looking up each widget's index.
+        # going backwards keeps the remaining indices valid as items are taken.
+        for index in reversed(range(layout.count())):
+            item = layout.itemAt(index)
+            if item is not None and item.widget() in existing_widgets:
+                layout.takeAt(index)
+
+        for existing_widget in self._widgets:
+            if existing_widget not in kept_widgets:
                 existing_widget.setParent(None)
                 existing_widget.deleteLater()
         self._widgets = list()
-        for widget in new_widgets:
-            self.add(widget)
+        self.add_many(new_widgets)
 
     def set_widgets(self, widgets):
         """Alias for widgets property setter."""
         self.widgets = widgets
 
+    def _set_size_policy(
+        self,
+        horizontal: t.Optional[_size_policy.Policy] = None,
+        vertical: t.Optional[_size_policy.Policy] = None,
+    ):
+        """Set the size policy, keeping the current policy for any None."""
+        if horizontal is None or vertical is None:
+            current = self.sizePolicy()
+            if horizontal is None:
+                horizontal = current.horizontalPolicy()
+            if vertical is None:
+                vertical = current.verticalPolicy()
+        self.setSizePolicy(horizontal, vertical)
+
     def set_shrinkwraps(self):
-        self.setSizePolicy(_size_policy.Minimum, _size_policy.Minimum)
+        self._set_size_policy(_size_policy.Minimum, _size_policy.Minimum)
 
     def set_shrinkwraps_horizontal(self):
-        self.setSizePolicy(_size_policy.Minimum, self.sizePolicy().verticalPolicy())
+        self._set_size_policy(horizontal=_size_policy.Minimum)
 
     def set_shrinkwraps_vertical(self):
-        self.setSizePolicy(self.sizePolicy().horizontalPolicy(), _size_policy.Minimum)
+        self._set_size_policy(vertical=_size_policy.Minimum)
 
     def set_uses_preferred_size(self):
-        self.setSizePolicy(_size_policy.Preferred, _size_policy.Preferred)
+        self._set_size_policy(_size_policy.Preferred, _size_policy.Preferred)
 
     def set_uses_preferred_size_horizontal(self):
-        self.setSizePolicy(_size_policy.Preferred, self.sizePolicy().verticalPolicy())
+        self._set_size_policy(horizontal=_size_policy.Preferred)
 
     def set_uses_preferred_size_vertical(self):
-        self.setSizePolicy(self.sizePolicy().horizontalPolicy(), _size_policy.Preferred)
+        self._set_size_policy(vertical=_size_policy.Preferred)
 
     # NOTE: MinimumExpanding is used in place of Expanding because it enforces the
     #       minimum size hint.  This can help prevent widgets from collapsing on top
     #       of each other in some cases.
 
     def set_expands(self):
-        self.setSizePolicy(_size_policy.MinimumExpanding, _size_policy.MinimumExpanding)
+        self._set_size_policy(
+            _size_policy.MinimumExpanding, _size_policy.MinimumExpanding
+        )
 
     def set_expands_horizontal(self):
-        self.setSizePolicy(
-            _size_policy.MinimumExpanding, self.sizePolicy().verticalPolicy()
-        )
+        self._set_size_policy(horizontal=_size_policy.MinimumExpanding)
 
     def set_expands_vertical(self):
-        self.setSizePolicy(
-            self.sizePolicy().horizontalPolicy(), _size_policy.MinimumExpanding
-        )
+        self._set_size_policy(vertical=_size_policy.MinimumExpanding)
 
 
 class VBlock(Block):
@@ -321,8 +394,7 @@ class ScrollBlock(Block):
         self.scroll_area.setWidget(self.inner_block)
         self._layout.addWidget(self.scroll_area)
 
-    @property
-    def layout(self):
+    def _resolve_layout(self) -> QtWidgets.QLayout:
         return self.inner_block.layout
 
     def always_show_scrollbar(self):
@@ -388,8 +460,7 @@ class GroupBlock(Block):
     def zero_outer_margins(self):
         self.outer_layout.setContentsMargins(0, 0, 0, 0)
 
-    @property
-    def layout(self):
+    def _resolve_layout(self) -> QtWidgets.QLayout:
         return self.inner_block.layout
 
     @property
@@ -1,8 +1,56 @@
-from typing import Optional, Dict, List
+from typing import Callable, Optional, Dict, List, Tuple
 
 from qtpy import QtCore, QtWidgets
 
 
+def _notifies(method):
+    """Wrap a container method so that it calls on_change afterwards."""
+
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self.on_change()
+        return result
+
+    return wrapper
+
+
+class _NotifyingDict(dict):
+    """A dict that calls a function whenever its contents change."""
+
+    def __init__(self, on_change: Callable[[], None], *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.on_change = on_change
+
+    __setitem__ = _notifies(dict.__setitem__)
+    __delitem__ = _notifies(dict.__delitem__)
+    clear = _notifies(dict.clear)
+    pop = _notifies(dict.pop)
+    popitem = _notifies(dict.popitem)
+    setdefault = _notifies(dict.setdefault)
+    update = _notifies(dict.update)
+
+
+class _NotifyingList(list):
+    """A list that calls a function whenever its contents change."""
+
+    def __init__(self, on_change: Callable[[], None], *args):
+        super().__init__(*args)
+        self.on_change = on_change
+
+    __setitem__ = _notifies(list.__setitem__)
+    __delitem__ = _notifies(list.__delitem__)
+    __iadd__ = _notifies(list.__iadd__)
+    __imul__ = _notifies(list.__imul__)
+    append = _notifies(list.append)
+    extend = _notifies(list.extend)
+    insert = _notifies(list.insert)
+    pop = _notifies(list.pop)
+    remove = _notifies(list.remove)
+    clear = _notifies(list.clear)
+    sort = _notifies(list.sort)
+    reverse = _notifies(list.reverse)
+
+
 class FlowLayout(QtWidgets.QLayout):
     """A layout that arranges widgets based on available horizontal space."""
 
@@ -11,11 +59,27 @@ class FlowLayout(QtWidgets.QLayout):
 
         self._item_list = []
 
+        # heights returned by heightForWidth, keyed by width.  Qt queries the
+        # same widths repeatedly while resizing, so this saves a full pass.
+        self._hfw_cache: Dict[int, int] = dict()
+
+        # the result of minimumSize, until the layout is invalidated
+        self._min_size_cache: Optional[QtCore.QSize] = None
+
+        # the size hint, width and height of each item, until the layout is
+        # invalidated.  Shared by every layout pass regardless of width.
+        self._hint_cache: Optional[List[Tuple[QtCore.QSize, int, int]]] = None
+
     # -- Reimplemented methods --------------------------------------------- #
 
+    def invalidate(self):
+        super().invalidate()
+        self._clear_caches()
+
     def addItem(self, item: QtWidgets.QLayoutItem):
         # this method is called under the hood by addWidget
         self._item_list.append(item)
+        self._clear_caches()
 
     def insertWidget(self, index, widget):
         self.addChildWidget(widget)
@@ -32,6 +96,7 @@ class FlowLayout(QtWidgets.QLayout):
             return None
 
     def takeAt(self, index) -> QtWidgets.QLayoutItem:
+        self._clear_caches()
         return self._item_list.pop(index)
 
     def hasHeightForWidth(self) -> bool:
@@ -44,7 +109,10 @@ class FlowLayout(QtWidgets.QLayout):
         Args:
             width (int): The width of the layout.
         """
-        height = self._do_layout(QtCore.QRect(0, 0, width, 0), calculate_only=True)
+        height = self._hfw_cache.get(width)
+        if height is None:
+            height = self._do_layout(QtCore.QRect(0, 0, width, 0), calculate_only=True)
+            self._hfw_cache[width] = height
         return height
 
     def setGeometry(self, rect: QtCore.QRect):
@@ -55,21 +123,42 @@ class FlowLayout(QtWidgets.QLayout):
         return self.minimumSize()
 
     def minimumSize(self) -> QtCore.QSize:
+        if self._min_size_cache is not None:
+            return QtCore.QSize(self._min_size_cache)
+
         size = QtCore.QSize()
 
         for item in self._item_list:
             size = size.expandedTo(item.minimumSize())
 
+        margins = self.contentsMargins()
         size += QtCore.QSize(
-            self.contentsMargins().top() * 2, self.contentsMargins().top() * 2
+            margins.left() + margins.right(), margins.top() + margins.bottom()
         )
-        return size
+        self._min_size_cache = size
+        return QtCore.QSize(size)
 
     def expandingDirections(self) -> QtCore.Qt.Orientations:
         return QtCore.Qt.Horizontal
 
+    def _clear_caches(self):
+        """Forget any cached size calculations."""
+        self._hfw_cache.clear()
+        self._min_size_cache = None
+        self._hint_cache = None
+
     # -- Layout Management ------------------------------------------------- #
 
+    def _get_item_hints(self) -> List[Tuple[QtCore.QSize, int, int]]:
+        """Get the size hint, width and height of every item in the layout."""
+        hints = self._hint_cache
+        if hints is None:
+            hints = self._hint_cache = list()
+            for item in self._item_list:
+                hint = item.sizeHint()
+                hints.append((hint, hint.width(), hint.height()))
+        return hints
+
     def _do_layout(self, rect: QtCore.QRect, calculate_only: bool) -> int:
         """Performs the actual layout calculation.
 
@@ -83,24 +172,27 @@ class FlowLayout(QtWidgets.QLayout):
         Returns:
             int: The total height of the layout with all widgets placed.
         """
-        x = rect.x()
+        left = rect.x()
+        right = rect.right()
+        x = left
         y = rect.y()
         line_height = 0
         spacing = self.spacing()
 
-        for item in self._item_list:
-            next_x = x + item.sizeHint().width() + spacing
-            if next_x - spacing > rect.right() and line_height > 0:
-                x = rect.x()
+        for item, (hint, width, height) in zip(self._item_list, self._get_item_hints()):
+            next_x = x + width + spacing
+            if next_x - spacing > right and line_height > 0:
+                x = left
                 y = y + line_height + spacing
-                next_x = x + item.sizeHint().width() + spacing
+                next_x = x + width + spacing
                 line_height = 0
 
             if not calculate_only:
-                item.setGeometry(QtCore.QRect(QtCore.QPoint(x, y), item.sizeHint()))
+                item.setGeometry(QtCore.QRect(QtCore.QPoint(x, y), hint))
 
             x = next_x
-            line_height = max(line_height, item.sizeHint().height())
+            if height > line_height:
+                line_height = height
 
         return y + line_height - rect.y()
 
@@ -124,18 +216,38 @@ class ColumnManager:
         """
         self._spacing = spacing or self.default_spacing
 
-        # The width of each column, in pixels.
-        self.column_widths: Dict[int, int] = dict()
+        # The width of each column, in pixels.  Changing it invalidates the
+        # cached widths.
+        self._column_widths: Dict[int, int] = _NotifyingDict(self.invalidate)
 
         # The layouts that are managed by this instance.  ColumnLayout classes
         # must register themselves with a ColumnManager instance
         self.managed_layouts: List[ColumnLayout] = list()
 
         # The columns that should be stretched to fill available space.
-        self.stretch_columns: List[int] = []
+        # Changing it invalidates the cached widths.
+        self._stretch_columns: List[int] = _NotifyingList(self.invalidate)
 
-        # The cached widths of each column, in pixels.
+        # The cached widths of each column, in pixels, and the layout width
+        # they were calculated for.  Stretched widths depend on that width.
         self.cached_widths: Dict[int, int] = dict()
+        self._cached_rect_width: Optional[int] = None
+
+        # The cached widths of each column without any stretch, in pixels.
+        self._nominal_cache: Dict[int, int] = dict()
+
+        # The cached right edge of each column relative to the left of the
+        # layout, calculated along with the cached widths.
+        self._column_positions: List[int] = list()
+
+        # The cached number of columns, validated across all managed layouts.
+        self._expected_count: Optional[int] = None
+
+        # Incremented whenever the cached widths are invalidated, so layouts
+        # can tell whether the widths they last applied are still current.
+        # Changes to spacing, column_widths and stretch_columns all go through
+        # invalidate, so they bump this as well.
+        self._generation = 0
 
     @property
     def spacing(self) -> int:
@@ -146,14 +258,44 @@ class ColumnManager:
         self._spacing = value
         self.invalidate()
 
+    @property
+    def column_widths(self) -> Dict[int, int]:
+        """Fixed widths for specific columns, keyed by column number."""
+        return self._column_widths
+
+    @column_widths.setter
+    def column_widths(self, value: Dict[int, int]):
+        self._column_widths = _NotifyingDict(self.invalidate, value)
+        self.invalidate()
+
+    @property
+    def stretch_columns(self) -> List[int]:
+        """The columns that should be stretched to fill available space."""
+        return self._stretch_columns
+
+    @stretch_columns.setter
+    def stretch_columns(self, value: List[int]):
+        self._stretch_columns = _NotifyingList(self.invalidate, value)
+        self.invalidate()
+
     def set_column_width(self, column: int, width: int):
         """Set a fixed width for a column"""
         self.column_widths[column] = width
-        self.invalidate()
 
     def invalidate(self):
-        """Invalidate the cached widths of all columns."""
+        """Invalidate the cached widths of all columns.
+
+        The minimum size of every managed layout depends on the widths of all
+        columns, so their cached sizes are cleared as well.
+        """
+        self._generation += 1
         self.cached_widths.clear()
+        self._cached_rect_width = None
+        self._nominal_cache.clear()
+        self._expected_count = None
+        self._column_positions.clear()
+        for layout in self.managed_layouts:
+            layout._min_size_cache = None
 
     @property
     def column_count(self) -> int:
@@ -163,10 +305,12 @@ class ColumnManager:
             ValueError: If the layouts have different column counts, the
                 column count cannot be determined.
         """
-        counts = list(set(layout.count() for layout in self.managed_layouts))
-        if len(counts) > 1:
-            raise ValueError("Column layouts have different column counts.")
-        return counts[0]
+        if self._expected_count is None:
+            counts = list(set(layout.count() for layout in self.managed_layouts))
+            if len(counts) > 1:
+                raise ValueError("Column layouts have different column counts.")
+            self._expected_count = counts[0]
+        return self._expected_count
 
     def get_nominal_column_width(self, column: int) -> int:
         """Get the width of a column without any stretch.
@@ -174,9 +318,9 @@ class ColumnManager:
         Typically, this will be the minimum size hint of the largest widget in
         the column.
         """
-        managed_widgets = [layout.itemAt(column) for layout in self.managed_layouts]
-        width = max([widget.sizeHint().width() for widget in managed_widgets if widget])
-        return width
+        if not self._nominal_cache:
+            self.precompute_nominals()
+        return self._nominal_cache[column]
 
     def get_column_width(self, column: int, rect: QtCore.QRect) -> int:
         """Get the actual column width for a column.
@@ -196,7 +340,7 @@ class ColumnManager:
             width = self.get_stretchable_width(column, rect) // len(
                 self.stretch_columns
             )
-            return self.get_nominal_column_width(column) + width
+            width += self.get_nominal_column_width(column)
 
         # use the nominal width
         else:
@@ -206,13 +350,62 @@ class ColumnManager:
 
         return width
 
+    def precompute_nominals(self):
+        """Calculate and cache the nominal widths of all columns at once.
+
+        Each managed widget is only visited once, rather than once per query
+        in get_nominal_column_width.
+        """
+        widths = self._nominal_cache
+        widths.clear()
+        for layout in self.managed_layouts:
+            for column in range(layout.count()):
+                width = layout.itemAt(column).sizeHint().width()
+                if width > widths.get(column, -1):
+                    widths[column] = width
+
+    def precompute_widths(self, rect: QtCore.QRect):
+        """Calculate and cache the actual widths of all columns at once.
+
+        Subsequent calls to get_column_width will return the cached values
+        until the manager is invalidated, or until widths are precomputed for
+        a layout of a different width.  The nominal widths are reused either
+        way, since they do not depend on the layout width.
+        """
+        self.cached_widths.clear()
+        if not self._nominal_cache:
+            self.precompute_nominals()
+        nominal_widths = [
+            self._nominal_cache[column] for column in range(len(self._nominal_cache))
+        ]
+        if self.stretch_columns:
+            summed = sum(nominal_widths) + self.spacing * len(nominal_widths)
+            stretch = max(0, rect.width() - summed) // len(self.stretch_columns)
+        else:
+            stretch = 0
+
+        for column, width in enumerate(nominal_widths):
+            if column in self.column_widths:
+                width = self.column_widths[column]
+            elif column in self.stretch_columns:
+                width += stretch
+            self.cached_widths[column] = width
+
+        # running sum of the column widths and spacing
+        positions = list()
+        x = 0
+        for width in self.cached_widths.values():
+            x += width
+            positions.append(x)
+            x += self.spacing
+        self._column_positions = positions
+        self._cached_rect_width = rect.width()
+
     def get_column_position(self, column: int, rect: QtCore.QRect) -> int:
         """Get the x position of a column."""
-        column += 1
-        x = rect.x()
-        for i in range(column):
-            x += self.get_column_width(i, rect) + self.spacing
-        return x - self.spacing
+        if rect.width() != self._cached_rect_width:
+            self.precompute_widths(rect)
+        return rect.x() + self._column_positions[column]
 
     def get_summed_nominal_width(self):
         """Get the total width of all columns and spacing without any stretch."""
@@ -231,6 +424,7 @@ class ColumnManager:
     def register(self, layout: "ColumnLayout"):
         """Add a layout to this manager."""
         self.managed_layouts.append(layout)
+        self._expected_count = None
 
 
 class ColumnLayout(QtWidgets.QHBoxLayout):
@@ -282,13 +476,16 @@ class ColumnLayout(QtWidgets.QHBoxLayout):
         self.manager = manager
         self.manager.register(self)
         self.item_list = []
-        self._rect = QtCore.QRect()
+        # the geometry and manager generation of the last applied layout
+        self._last_layout_key: Optional[Tuple[Tuple[int, int, int, int], int]] = None
+        self._min_size_cache: Optional[QtCore.QSize] = None
 
     # -- Reimplemented methods --------------------------------------------- #
 
     def invalidate(self):
         super().invalidate()
-        self._rect = None
+        # a change to this layout may change the widths of every column
+        self.manager.invalidate()
 
     def setSpacing(self, spacing: int):
         raise NotImplementedError("Spacing is managed by the ColumnManager.")
@@ -304,6 +501,9 @@ class ColumnLayout(QtWidgets.QHBoxLayout):
         return self.minimumSize()
 
     def minimumSize(self) -> QtCore.QSize:
+        if self._min_size_cache is not None:
+            return QtCore.QSize(self._min_size_cache)
+
         size = QtCore.QSize()
 
         max_height = max(
@@ -314,7 +514,8 @@ class ColumnLayout(QtWidgets.QHBoxLayout):
         # take spacing into account
         size.setHeight(max_height)
         size.setWidth(width)
-        return size
+        self._min_size_cache = size
+        return QtCore.QSize(size)
 
     def _do_layout(self, rect: QtCore.QRect):
         """Performs the actual layout calculation.
@@ -323,18 +524,26 @@ class ColumnLayout(QtWidgets.QHBoxLayout):
             rect (QtCore.QRect): The rectangle to lay the widgets out in. This
                 should be provided by the parent widget's geometry.
         """
-        if rect == self._rect:
+        # nothing to do if neither the geometry nor the column widths have
+        # changed since the last time the layout was applied.
+        manager = self.manager
+        geometry = (rect.x(), rect.y(), rect.width(), rect.height())
+        if self._last_layout_key == (geometry, manager._generation):
             return
-        self._rect = rect
         rect = self.alignmentRect(rect)
-        self.manager.invalidate()
+
+        # the shared column widths are stale if the manager was invalidated,
+        # or if they were last calculated for a row of a different width.
+        if rect.width() != manager._cached_rect_width:
+            manager.precompute_widths(rect)
+        self._last_layout_key = (geometry, manager._generation)
         x = rect.x()
         y = rect.y()
-        spacing = self.spacing()
+        row_height = rect.height()
+        spacing = manager.spacing
         for i in range(self.count()):
             item = self.itemAt(i)
-            row_height = rect.height()
-            column_width = self.manager.get_column_width(i, rect)
+            column_width = manager.get_column_width(i, rect)
             new_geo = QtCore.QRect(x, y, column_width, row_height)
             item.setGeometry(new_geo)
             x += column_width + spacing